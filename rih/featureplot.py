@@ -1,4 +1,5 @@
 import logging
+import re
 from pathlib import Path
 
 import censusdis.data as ced
@@ -12,6 +13,11 @@ from rih.util import read_data
 
 logger = logging.getLogger(__name__)
 
+# Pieces of ACS variable labels that we strip or rewrite to make
+# them readable in plot titles and file names.
+_LABEL_CLEANUP_RE = re.compile(r"Estimate!!Total:!!|:!!|:")
+_LABEL_REPLACEMENTS = {":!!": "; "}
+
 
 def main():
     parser = LoggingArgumentParser(logger)
@@ -43,6 +49,9 @@ def main():
 
     args = parser.parse_args()
 
+    # Plots only ever go to files.
+    plt.switch_backend("Agg")
+
     logging.info(f"{args.input_file} -> {args.output_dir}")
 
     highlight_feature_above = args.highlight_feature_above
@@ -71,11 +80,23 @@ def main():
     )
     do_emphasize = do_emphasize_feature or do_emphasize_value
 
-    gdf_cbsa_bg = read_data(args.input_file, drop_outliers=True)
+    gdf_cbsa_bg = read_data(args.input_file, drop_outliers=True, ignore_geometry=True)
 
     year = args.vintage
     all_variables = ced.variables.all_variables(ACS5, year, util.GROUP_RACE_ETHNICITY)
 
+    # Clean up all the labels once up front rather than looking
+    # each one up and rewriting it inside the feature loop.
+    labels = (
+        all_variables.set_index("VARIABLE")["LABEL"]
+        .str.replace(
+            _LABEL_CLEANUP_RE,
+            lambda m: _LABEL_REPLACEMENTS.get(m.group(0), ""),
+            regex=True,
+        )
+        .to_dict()
+    )
+
     dollar_formatter = FuncFormatter(
         lambda d, pos: f"\\${d:,.0f}" if d >= 0 else f"(\\${-d:,.0f})"
     )
@@ -94,21 +115,17 @@ def main():
 
         variable = feature[5:]  # Remove leading "frac_"
 
-        label = all_variables[all_variables["VARIABLE"] == variable]["LABEL"].iloc[0]
-
-        label = label.replace("Estimate!!Total:!!", "")
-        label = label.replace(":!!", "; ")
-        label = label.replace(":", "")
+        label = labels[variable]
 
         if do_emphasize or do_highlight:
             color = "lightgray"
         else:
             color = "C0"
 
-        ax = gdf_cbsa_bg.plot.scatter(
-            feature,
-            util.VARIABLE_MEDIAN_VALUE,
-            figsize=(12, 8),
+        fig, ax = plt.subplots(figsize=(12, 8))
+        ax.scatter(
+            gdf_cbsa_bg[feature].to_numpy(),
+            gdf_cbsa_bg[util.VARIABLE_MEDIAN_VALUE].to_numpy(),
             s=2,
             color=color,
         )
@@ -160,8 +177,7 @@ def main():
         ax.set_ylabel("Median Home Value")
 
         if do_highlight or do_emphasize:
-            for handle in ax.legend().legend_handles:
-                handle._sizes = [25]
+            util.legend_with_uniform_markers(ax)
 
         if args.output_file_name is not None:
             file_path = Path(args.output_dir) / args.output_file_name
@@ -170,6 +186,7 @@ def main():
             file_path = Path(args.output_dir) / f"{filename}.png"
 
         plt.savefig(file_path)
+        plt.close(fig)
 
 
 def filter_and_plot(
@@ -231,14 +248,12 @@ def filter_and_plot(
 
     plot_label = f"{plot_label} (n = {len(gdf_cbsa_bg.index):,.0f})"
 
-    ax = gdf_cbsa_bg.plot.scatter(
-        feature,
-        util.VARIABLE_MEDIAN_VALUE,
-        figsize=(12, 8),
+    ax.scatter(
+        gdf_cbsa_bg[feature].to_numpy(),
+        gdf_cbsa_bg[util.VARIABLE_MEDIAN_VALUE].to_numpy(),
         s=size,
         label=plot_label,
         color=color,
-        ax=ax,
     )
     return ax, gdf_cbsa_bg
 
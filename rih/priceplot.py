@@ -9,6 +9,7 @@ from rih.util import (
     VARIABLE_MEDIAN_INCOME,
     VARIABLE_MEDIAN_VALUE,
     read_data,
+    legend_with_uniform_markers,
     MAX_INCOME,
     MAX_PRICE,
 )
@@ -27,12 +28,14 @@ def main():
 
     args = parser.parse_args()
 
+    plt.switch_backend("Agg")
+
     logger.info(f"Input file: {args.input_file}")
 
     input_file = args.input_file
     output_file = args.output_file
 
-    gdf_cbsa_bg = read_data(input_file, drop_outliers=False)
+    gdf_cbsa_bg = read_data(input_file, drop_outliers=False, ignore_geometry=True)
 
     df_data = gdf_cbsa_bg[[VARIABLE_MEDIAN_INCOME, VARIABLE_MEDIAN_VALUE]][
         (gdf_cbsa_bg[VARIABLE_MEDIAN_INCOME] < MAX_INCOME)
@@ -43,22 +46,20 @@ def main():
         | (gdf_cbsa_bg[VARIABLE_MEDIAN_VALUE] >= MAX_PRICE)
     ]
 
-    ax = df_data.plot.scatter(
-        VARIABLE_MEDIAN_INCOME,
-        VARIABLE_MEDIAN_VALUE,
+    fig, ax = plt.subplots(figsize=(12, 8))
+
+    ax.scatter(
+        df_data[VARIABLE_MEDIAN_INCOME].to_numpy(),
+        df_data[VARIABLE_MEDIAN_VALUE].to_numpy(),
         label=f"Data Points (n = {len(df_data.index):,d})",
-        legend=True,
-        figsize=(12, 8),
         s=2,
     )
 
-    ax = df_outliers.plot.scatter(
-        VARIABLE_MEDIAN_INCOME,
-        VARIABLE_MEDIAN_VALUE,
+    ax.scatter(
+        df_outliers[VARIABLE_MEDIAN_INCOME].to_numpy(),
+        df_outliers[VARIABLE_MEDIAN_VALUE].to_numpy(),
         color="red",
         label=f"Outliers (n = {len(df_outliers.index):,d})",
-        legend=True,
-        ax=ax,
         s=1,
     )
 
@@ -73,8 +74,7 @@ def main():
     ax.set_xlabel("Median Household Income")
     ax.set_ylabel("Median Home Value")
 
-    for handle in ax.legend().legend_handles:
-        handle._sizes = [25]
+    legend_with_uniform_markers(ax)
 
     dollar_formatter = FuncFormatter(
         lambda d, pos: f"\\${d:,.0f}" if d >= 0 else f"(\\${-d:,.0f})"
@@ -85,6 +85,7 @@ def main():
     logger.info(f"Output file: {output_file}")
 
     plt.savefig(output_file)
+    plt.close(fig)
 
 
 if __name__ == "__main__":
@@ -23,7 +23,9 @@ def main():
 
     logger.info(f"Reading from {args.input_file}")
 
-    gdf = pd.concat(gpd.read_file(file) for file in args.input_file)
+    gdf = pd.concat(
+        gpd.read_file(file, ignore_geometry=True) for file in args.input_file
+    )
 
     stats = gdf[
         [
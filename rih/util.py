@@ -1,7 +1,13 @@
 """Utilities to support notebooks in this project."""
 
+from typing import Union
+
 import pandas as pd
 import geopandas as gpd
+from matplotlib.axes import Axes
+from matplotlib.collections import PathCollection
+from matplotlib.legend import Legend
+from matplotlib.lines import Line2D
 from censusdis import data as ced
 from censusdis.datasets import ACS5
 
@@ -147,16 +153,47 @@ MAX_INCOME = 250_001
 MAX_PRICE = 2_000_001
 
 
-def read_data(filename: str, drop_outliers: bool = True, **kwargs) -> gpd.GeoDataFrame:
-    """Read a data file and optionally drop outliers."""
-    gdf = gpd.read_file(filename, **kwargs)
+def read_data(
+    filename: str, drop_outliers: bool = True, ignore_geometry: bool = False, **kwargs
+) -> Union[pd.DataFrame, gpd.GeoDataFrame]:
+    """
+    Read a data file and optionally drop outliers.
+
+    If `ignore_geometry` is true, the result is a plain `pd.DataFrame`.
+    """
+    gdf = gpd.read_file(filename, ignore_geometry=ignore_geometry, **kwargs)
 
     if drop_outliers:
-        gdf = gpd.GeoDataFrame(
-            gdf[
-                (gdf[VARIABLE_MEDIAN_VALUE] < MAX_PRICE)
-                & (gdf[VARIABLE_MEDIAN_INCOME] < MAX_INCOME)
-            ]
-        )
+        gdf = gdf[
+            (gdf[VARIABLE_MEDIAN_VALUE] < MAX_PRICE)
+            & (gdf[VARIABLE_MEDIAN_INCOME] < MAX_INCOME)
+        ]
+        if not ignore_geometry:
+            gdf = gpd.GeoDataFrame(gdf)
 
     return gdf
+
+
+def legend_with_uniform_markers(ax: Axes, markersize: float = 5, **kwargs) -> Legend:
+    """Add a legend in which every scatter layer gets a same-sized marker."""
+    handles, labels = ax.get_legend_handles_labels()
+
+    def _uniform(handle):
+        if not isinstance(handle, PathCollection):
+            return handle
+        face_colors = handle.get_facecolor()
+        edge_colors = handle.get_edgecolor()
+        # Hollow markers have no face color, so keep them hollow.
+        face_color = face_colors[0] if len(face_colors) else "none"
+        edge_color = edge_colors[0] if len(edge_colors) else face_color
+        return Line2D(
+            [],
+            [],
+            marker="o",
+            linestyle="",
+            markerfacecolor=face_color,
+            markeredgecolor=edge_color,
+            markersize=markersize,
+        )
+
+    return ax.legend([_uniform(handle) for handle in handles], labels, **kwargs)